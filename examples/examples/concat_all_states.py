@@ -0,0 +1,45 @@
+import os
+import glob
+import argparse
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
+
+# Matches the default --output_dir of fetch_all_states.py
+SITE_PROPERTIES_DIR = 'site_properties'
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Combine the per-state Arrow files written by fetch_all_states.py --output_format arrow.")
+    parser.add_argument('--input_dir', type=str, default=SITE_PROPERTIES_DIR, help='Directory holding <STATE>_properties.arrow files')
+    parser.add_argument('--output', type=str, default='all_states.arrow', help='Combined Arrow IPC file to write')
+    return parser.parse_args()
+
+def normalize_dictionary_columns(table):
+    # Same normalisation fetch_all_states.py applies per state, repeated for files written before it did;
+    # Arrow cannot unify null-valued dictionaries with string ones
+    for i, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type):
+            # Re-encoding from plain strings also drops the null entry a null-valued dictionary carries
+            column = pc.dictionary_encode(table.column(i).cast(pa.string()))
+            table = table.set_column(i, pa.field(field.name, column.type, field.nullable, field.metadata), column)
+    return table
+
+def read_state_table(path):
+    # Memory-mapped, so column buffers stay on disk until they are actually touched
+    with pa.memory_map(path, 'r') as source:
+        return pa.ipc.open_file(source).read_all()
+
+def main():
+    args = parse_args()
+    paths = sorted(glob.glob(os.path.join(args.input_dir, '*_properties.arrow')))
+    if not paths:
+        print(f"No Arrow files found in {args.input_dir}")
+        return
+    tables = [normalize_dictionary_columns(read_state_table(path)) for path in paths]
+    # Columns can be all-null in one state and typed in another
+    combined = pa.concat_tables(tables, promote_options='permissive')
+    feather.write_feather(combined, args.output, compression='uncompressed')
+    print(f"Wrote {combined.num_rows} properties from {len(paths)} states to {args.output}")
+
+if __name__ == "__main__":
+    main()
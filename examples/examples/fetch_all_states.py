@@ -1,12 +1,30 @@
 import os
 import sys
+import json
+import hashlib
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from homeharvest import scrape_property
 import pandas as pd
-from multiprocessing import Pool, cpu_count
+from multiprocessing import Pool, Queue, cpu_count
+from concurrent.futures import ThreadPoolExecutor
 import argparse
 
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  #: pyarrow is only needed for --output_format parquet/arrow
+    pa = feather = pc = pq = None
+
+try:
+    from diskcache import Cache
+except ImportError:  #: without diskcache every run goes to the network
+    Cache = None
+
 # List of all US states (abbreviations)
 US_STATES = [
     'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
@@ -18,6 +36,10 @@ US_STATES = [
 
 LISTING_TYPES = ['sold', 'for_sale', 'for_rent', 'pending']
 DAYS_PER_CHUNK = 30
+# Most rows a single scrape_property call can return; only larger windows are split into date buckets
+SCRAPE_LIMIT = 10000
+CATEGORY_COLUMNS = ('state', 'status', 'style', 'mls', 'city', 'county')
+ARROW_FORMATS = ('parquet', 'arrow')
 START_DATE = datetime(2024, 1, 1)
 END_DATE = datetime.now()
 
@@ -27,11 +49,86 @@ os.makedirs(SITE_PROPERTIES_DIR, exist_ok=True)
 OUTPUT_DIR = 'state_exports'
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-logging.basicConfig(
-    filename='fetch_all_states.log',
-    level=logging.INFO,
-    format='%(asctime)s %(levelname)s %(message)s',
-)
+# Scraped column -> export column name, kept for reference only: exports currently keep every scraped column
+# under its original name, so nothing reads this mapping.
+COLUMNS_MAP = {
+    # 1. Price
+    'list_price': 'Listing Price',
+    # 2. Images
+    'photos': 'Images',
+    'virtual_tour_url': 'Virtual Tour',
+    # 3. Property Details
+    'beds': 'Bedrooms',
+    'full_baths': 'Full Baths',
+    'half_baths': 'Half Baths',
+    'sqft': 'Square Footage',
+    'year_built': 'Year Built',
+    'lot_sqft': 'Lot Size',
+    'stories': 'Stories',
+    # 4. Pricing Metrics
+    'price_per_sqft': 'Price per Sqft',
+    'estimated_value': 'Estimated Market Value',
+    'price_history': 'Price History',
+    # 5. Financial & Fees
+    'hoa_fee': 'Monthly HOA Fee',
+    'monthly_cost': 'Monthly Cost Calculator',
+    'estimated_monthly_payment': 'Estimated Monthly Payments',
+    # 6. Property Description & Highlights
+    'description': "What's Special About This Property",
+    'features': 'Features & Upgrades',
+    'special_features': 'Unique Selling Points',
+    # 7. Multimedia & Virtual Tours
+    'tour_3d_url': '3D Tour',
+    'video_tour_url': 'Video Tour',
+    # 8. Source & Listing Data
+    'agent_name': 'Listed By',
+    'mls_id': 'MLS Number',
+    'mls': 'Originating MLS',
+    # 9. Legal & Tax Information
+    'tax_history': 'Public Tax History',
+    'tax': 'Tax Assessed Value',
+    # 10. Facts & Features
+    'property_type': 'Property Type',
+    'interior_features': 'Interior Features',
+    'exterior_features': 'Exterior Features',
+    # 11. Historical Data
+    'sale_history': 'Sale History',
+    # 12. Environmental & Climate Risk
+    'climate_risk': 'Climate Risk',
+    # 13. Getting Around
+    'commute': 'Getting Around',
+    # 14. Nearby Amenities & Education
+    'nearby_schools': 'Nearby Schools',
+    'nearby_cities': 'Nearby Cities',
+    'parks': 'Parks & Recreation',
+}
+
+# On-disk cache of scrape results so re-runs skip the network; pass --no_cache to force a refetch
+SCRAPE_CACHE_DIR = '.scrape_cache'
+SCRAPE_CACHE_TTL = 24 * 60 * 60
+# Opened once per process by init_worker, before any fetch threads start
+_scrape_cache = None
+
+LOG_FILE = 'fetch_all_states.log'
+LOG_FORMAT = '%(asctime)s %(levelname)s %(message)s'
+
+@dataclass(frozen=True)
+class ScrapeConfig:
+    """
+    Run-wide settings shared by every state task, handed to each worker once via the pool initializer.
+    """
+    listing_types: tuple
+    start_date: str
+    end_date: str
+    max_rows: int
+    output_dir: str
+    output_format: str
+    overwrite: bool
+    extra_property_data: bool
+    use_cache: bool
+
+# Set in each worker by init_worker, so tasks only need to carry the state code
+_CFG = None
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Fetch real estate data for US states using HomeHarvest.")
@@ -41,23 +138,58 @@ def parse_args():
     parser.add_argument('--end_date', type=str, default=datetime.now().strftime('%Y-%m-%d'), help='End date (YYYY-MM-DD)')
     parser.add_argument('--output_dir', type=str, default=SITE_PROPERTIES_DIR, help='Output directory')
     parser.add_argument('--max_rows', type=int, default=500, help='Max properties per state')
-    parser.add_argument('--output_format', choices=['csv', 'excel'], default='csv', help='Output file format')
+    parser.add_argument('--output_format', choices=['csv', 'excel', 'parquet', 'arrow'], default='csv', help='Output file format')
     parser.add_argument('--processes', type=int, default=1, help='Number of parallel processes')
-    parser.add_argument('--overwrite', action='store_true', help='Overwrite existing files')
-    return parser.parse_args()
+    parser.add_argument('--overwrite', action='store_true', help='Overwrite existing files (scrapes cached in the last 24h are still reused unless --no_cache is given)')
+    parser.add_argument('--no_cache', action='store_true', help='Always fetch from the network, bypassing the on-disk scrape cache')
+    parser.add_argument('--no_extra_details', action='store_true', help='Skip the extra per-property detail lookups (schools, tax history)')
+    args = parser.parse_args()
+    if args.output_format in ARROW_FORMATS and pa is None:
+        parser.error(f"--output_format {args.output_format} requires pyarrow (pip install pyarrow)")
+    return args
+
+def init_worker(cfg, log_queue=None):
+    global _CFG, _scrape_cache
+    _CFG = cfg
+    # Each process opens its own cache rather than sharing a forked SQLite connection
+    _scrape_cache = Cache(SCRAPE_CACHE_DIR) if cfg.use_cache and Cache is not None else None
+    if log_queue is not None:
+        init_worker_logging(log_queue)
+
+def init_worker_logging(log_queue):
+    # Send worker records to the parent's listener instead of every worker writing the log file
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+def cached_scrape(**kwargs):
+    """
+    scrape_property, memoized on disk by its arguments for SCRAPE_CACHE_TTL seconds.
+    """
+    cache = _scrape_cache
+    if cache is None:
+        return scrape_property(**kwargs)
+    key = hashlib.sha256(json.dumps(kwargs, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    properties = cache.get(key)
+    if properties is None:
+        properties = scrape_property(**kwargs)
+        cache.set(key, properties, expire=SCRAPE_CACHE_TTL)
+    return properties
 
-def fetch_state_10000(state, listing_type):
+def fetch_state_10000(state, listing_type, extra_property_data=True):
     """
     Fetch up to 10,000 properties for a state and listing type, and return as DataFrame.
     """
     try:
-        properties = scrape_property(
+        properties = cached_scrape(
             location=state,
             listing_type=listing_type,
             date_from=START_DATE.strftime('%Y-%m-%d'),
             date_to=END_DATE.strftime('%Y-%m-%d'),
             limit=10000,
-            extra_property_data=True  # Fetch extra details for each property
+            extra_property_data=extra_property_data  # Fetch extra details for each property
         )
         if len(properties) > 0:
             return properties
@@ -68,119 +200,273 @@ def fetch_state_10000(state, listing_type):
         logging.error(f"Error fetching {state} {listing_type}: {e}")
         return None
 
-def fetch_state_custom(state, listing_types, start_date, end_date, max_rows):
-    all_chunks = []
-    for listing_type in listing_types:
-        try:
-            properties = scrape_property(
-                location=state,
-                listing_type=listing_type,
-                date_from=start_date,
-                date_to=end_date,
-                limit=max_rows,
-                extra_property_data=True
-            )
+def scrape_date_range(state, listing_type, date_from, date_to, limit, extra_property_data=True):
+    try:
+        return cached_scrape(
+            location=state,
+            listing_type=listing_type,
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit,
+            extra_property_data=extra_property_data
+        )
+    except Exception as e:
+        logging.error(f"Error fetching {state} {listing_type} ({date_from} to {date_to}): {e}")
+        return None
+
+def iter_date_ranges(start_date, end_date, days=DAYS_PER_CHUNK):
+    """
+    Split an inclusive YYYY-MM-DD range into (date_from, date_to) buckets of at most `days` days, newest first.
+    """
+    first = datetime.strptime(start_date, '%Y-%m-%d')
+    bucket_end = datetime.strptime(end_date, '%Y-%m-%d')
+    while bucket_end >= first:
+        bucket_start = max(bucket_end - timedelta(days=days - 1), first)
+        yield bucket_start.strftime('%Y-%m-%d'), bucket_end.strftime('%Y-%m-%d')
+        bucket_end = bucket_start - timedelta(days=1)
+
+def fetch_listing_type(state, listing_type, start_date, end_date, max_rows, extra_property_data=True):
+    """
+    Fetch up to max_rows properties of one listing type for a state.
+    A single scrape already fetches its result pages concurrently, so the date window is only split into
+    DAYS_PER_CHUNK-day buckets when max_rows is more than one scrape can return. Buckets are then fetched
+    newest first and no further buckets are requested once max_rows is reached.
+    """
+    if max_rows <= SCRAPE_LIMIT:
+        return scrape_date_range(state, listing_type, start_date, end_date, max_rows, extra_property_data)
+    try:
+        date_ranges = list(iter_date_ranges(start_date, end_date))
+    except ValueError:
+        date_ranges = []
+    if not date_ranges:
+        # Malformed or reversed range, let scrape_property reject it so the error is logged
+        return scrape_date_range(state, listing_type, start_date, end_date, SCRAPE_LIMIT, extra_property_data)
+    frames = []
+    seen_ids = set()
+    for date_from, date_to in date_ranges:
+        limit = min(max_rows - len(seen_ids), SCRAPE_LIMIT)
+        properties = scrape_date_range(state, listing_type, date_from, date_to, limit, extra_property_data)
+        if properties is not None and len(properties) > 0:
+            # A property can fall in neighbouring buckets, so only its first (newest) copy counts towards max_rows
+            properties = properties.drop_duplicates(subset='property_id')
+            properties = properties[~properties['property_id'].isin(seen_ids)]
             if len(properties) > 0:
-                # Limit to 500 properties per state
-                all_chunks.append(properties.head(max_rows))
-        except Exception as e:
-            logging.error(f"Error fetching {state} {listing_type}: {e}")
+                seen_ids.update(properties['property_id'])
+                frames.append(properties)
+        if len(seen_ids) >= max_rows:
+            break
+    if not frames:
+        return None
+    # Buckets are newest first, so trimming keeps the most recent properties
+    properties = pd.concat(frames, ignore_index=True, copy=False)
+    return properties.iloc[:max_rows]
+
+def iter_state_chunks(state, listing_types, start_date, end_date, max_rows, extra_property_data=True):
+    """
+    Yield (listing_type, DataFrame) pairs for a state in listing_types order, until max_rows is reached.
+    Listing types are fetched concurrently since the work is network-bound, but results are taken in
+    submission order so earlier listing types keep priority for the per-state budget.
+    """
+    remaining = max_rows
+    # One worker per listing type means every fetch starts immediately, so stopping early cannot cancel
+    # any of them; leaving the block waits for the ones still running and drops their results.
+    with ThreadPoolExecutor(max_workers=max(len(listing_types), 1)) as executor:
+        futures = [
+            (listing_type, executor.submit(
+                fetch_listing_type, state, listing_type, start_date, end_date, max_rows, extra_property_data
+            ))
+            for listing_type in listing_types
+        ]
+        for listing_type, future in futures:
+            properties = future.result()
+            if properties is not None and len(properties) > 0:
+                # Only keep what still fits under max_rows for this state
+                chunk = properties.iloc[:remaining]
+                remaining -= len(chunk)
+                yield listing_type, chunk
+            if remaining <= 0:
+                break
+
+def fetch_state_custom(state, listing_types, start_date, end_date, max_rows, extra_property_data=True):
+    all_chunks = [
+        chunk for _, chunk in iter_state_chunks(state, listing_types, start_date, end_date, max_rows, extra_property_data)
+    ]
     if all_chunks:
-        df_state = pd.concat(all_chunks, ignore_index=True)
-        return df_state.head(max_rows)
+        return pd.concat(all_chunks, ignore_index=True, copy=False)
     return None
 
-def process_state_cli(args_tuple):
-    state, listing_types, start_date, end_date, max_rows, output_dir, output_format, overwrite, columns_map = args_tuple
-    filename = os.path.join(output_dir, f"{state}_properties.csv")
-    json_filename = os.path.join(output_dir, f"{state}_properties.json")
-    if os.path.exists(filename) and os.path.exists(json_filename) and not overwrite:
+def prepare_export_chunk(df):
+    # Export all columns, including images and 3D tour views
+    # Ensure 'photos' and 'tour_3d_url' columns exist, adding any missing ones in a single reindex
+    missing = [col for col in ('photos', 'tour_3d_url') if col not in df.columns]
+    if missing:
+        df = df.reindex(columns=[*df.columns, *missing], copy=False)
+    return df
+
+def to_arrow_chunk(df):
+    # Low-cardinality text columns are far smaller as categoricals than as object dtype. Only worth it on the
+    # buffered Arrow path; all-null columns are left alone since they would become null-valued dictionaries.
+    categories = {col: 'category' for col in CATEGORY_COLUMNS if col in df.columns and df[col].notna().any()}
+    return normalize_dictionary_columns(pa.Table.from_pandas(df.astype(categories, copy=False), preserve_index=False))
+
+def normalize_dictionary_columns(table):
+    # Give every dictionary column the same int32-indexed string type, so chunks and state files always
+    # concatenate and write; Arrow cannot unify null-valued dictionaries with string ones
+    for i, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type):
+            # Re-encoding from plain strings also drops the null entry a null-valued dictionary carries
+            column = pc.dictionary_encode(table.column(i).cast(pa.string()))
+            table = table.set_column(i, pa.field(field.name, column.type, field.nullable, field.metadata), column)
+    return table
+
+def state_result_path(output_dir, state, ext):
+    return os.path.join(output_dir, f"{state}_properties.{ext}")
+
+def state_output_paths(cfg, state):
+    if cfg.output_format in ARROW_FORMATS:
+        return [state_result_path(cfg.output_dir, state, cfg.output_format)]
+    return [state_result_path(cfg.output_dir, state, 'csv'), state_result_path(cfg.output_dir, state, 'json')]
+
+def state_is_exported(cfg, state):
+    return all(os.path.exists(path) for path in state_output_paths(cfg, state))
+
+def remove_partial_files(*paths):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+def process_state_arrow(state, cfg):
+    filename = state_result_path(cfg.output_dir, state, cfg.output_format)
+    if state_is_exported(cfg, state) and not cfg.overwrite:
+        logging.info(f"Skipping {filename}, already exists.")
+        print(f"Skipping {filename}, already exists.")
+        return
+    # Arrow tables are columnar and far smaller than object-dtype frames, so buffer them per state
+    tables = [
+        to_arrow_chunk(prepare_export_chunk(chunk))
+        for _, chunk in iter_state_chunks(
+            state, cfg.listing_types, cfg.start_date, cfg.end_date, cfg.max_rows, cfg.extra_property_data
+        )
+    ]
+    if not tables:
+        logging.info(f"No data for {state}")
+        print(f"No data for {state}")
+        return
+    # Promote columns that were all-null in one chunk but typed in another
+    table = pa.concat_tables(tables, promote_options='permissive')
+    # Write under a temporary name so an interrupted write is never mistaken for a finished export
+    tmp_filename = f"{filename}.tmp"
+    try:
+        if cfg.output_format == 'parquet':
+            pq.write_table(table, tmp_filename, compression='zstd')
+        else:
+            # Uncompressed Arrow IPC so concat_all_states.py can memory-map it without decoding
+            feather.write_feather(table, tmp_filename, compression='uncompressed')
+    except BaseException:
+        remove_partial_files(tmp_filename)
+        raise
+    os.replace(tmp_filename, filename)
+    logging.info(f"Saved {table.num_rows} properties for {state} to {filename}")
+    print(f"Saved {table.num_rows} properties for {state} to {filename}")
+
+def process_state_cli(state):
+    cfg = _CFG
+    if cfg.output_format in ARROW_FORMATS:
+        return process_state_arrow(state, cfg)
+    filename = state_result_path(cfg.output_dir, state, 'csv')
+    json_filename = state_result_path(cfg.output_dir, state, 'json')
+    if state_is_exported(cfg, state) and not cfg.overwrite:
         logging.info(f"Skipping {filename} and {json_filename}, already exist.")
         print(f"Skipping {filename} and {json_filename}, already exist.")
         return
-    df_state = fetch_state_custom(state, listing_types, start_date, end_date, max_rows)
-    if df_state is not None:
-        # Export all columns, including images and 3D tour views
-        df_export = df_state.copy()
-        # Ensure 'photos' and 'tour_3d_url' columns exist
-        if 'photos' not in df_export.columns:
-            df_export['photos'] = None
-        if 'tour_3d_url' not in df_export.columns:
-            df_export['tour_3d_url'] = None
-        # Export CSV
-        df_export.to_csv(filename, index=False)
-        # Export JSON (records format)
-        df_export.to_json(json_filename, orient='records', lines=False, force_ascii=False)
-        logging.info(f"Saved {len(df_export)} properties for {state} to {filename} and {json_filename}")
-        print(f"Saved {len(df_export)} properties for {state} to {filename} and {json_filename}")
+    # Stream each listing type's chunk straight to disk so only one chunk is held in memory at a time.
+    # Chunks go to temporary files that only replace the real ones once every listing type is written,
+    # so an interrupted state is never mistaken for a finished export.
+    tmp_filename = f"{filename}.tmp"
+    tmp_json_filename = f"{json_filename}.tmp"
+    total = 0
+    csv_fh = json_fh = None
+    try:
+        for listing_type, chunk in iter_state_chunks(
+            state, cfg.listing_types, cfg.start_date, cfg.end_date, cfg.max_rows, cfg.extra_property_data
+        ):
+            df_export = prepare_export_chunk(chunk)
+            if csv_fh is None:
+                csv_fh = open(tmp_filename, 'w', newline='', encoding='utf-8')
+                json_fh = open(tmp_json_filename, 'w', encoding='utf-8')
+                json_fh.write('[')
+            else:
+                json_fh.write(',')
+            # Export CSV, header only with the first chunk
+            df_export.to_csv(csv_fh, index=False, header=(total == 0))
+            # Export JSON (records format), splicing each chunk's records into one array
+            json_fh.write(df_export.to_json(orient='records', lines=False, force_ascii=False)[1:-1])
+            total += len(df_export)
+        if json_fh is not None:
+            json_fh.write(']')
+    except BaseException:
+        for fh in (csv_fh, json_fh):
+            if fh is not None:
+                fh.close()
+        remove_partial_files(tmp_filename, tmp_json_filename)
+        raise
+    finally:
+        for fh in (csv_fh, json_fh):
+            if fh is not None:
+                fh.close()
+    if total > 0:
+        os.replace(tmp_filename, filename)
+        os.replace(tmp_json_filename, json_filename)
+        logging.info(f"Saved {total} properties for {state} to {filename} and {json_filename}")
+        print(f"Saved {total} properties for {state} to {filename} and {json_filename}")
     else:
         logging.info(f"No data for {state}")
         print(f"No data for {state}")
 
 def main():
     args = parse_args()
+    file_handler = logging.FileHandler(LOG_FILE)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    logging.basicConfig(level=logging.INFO, handlers=[file_handler])
     os.makedirs(args.output_dir, exist_ok=True)
-    columns_map = {
-        # 1. Price
-        'list_price': 'Listing Price',
-        # 2. Images
-        'photos': 'Images',
-        'virtual_tour_url': 'Virtual Tour',
-        # 3. Property Details
-        'beds': 'Bedrooms',
-        'full_baths': 'Full Baths',
-        'half_baths': 'Half Baths',
-        'sqft': 'Square Footage',
-        'year_built': 'Year Built',
-        'lot_sqft': 'Lot Size',
-        'stories': 'Stories',
-        # 4. Pricing Metrics
-        'price_per_sqft': 'Price per Sqft',
-        'estimated_value': 'Estimated Market Value',
-        'price_history': 'Price History',
-        # 5. Financial & Fees
-        'hoa_fee': 'Monthly HOA Fee',
-        'monthly_cost': 'Monthly Cost Calculator',
-        'estimated_monthly_payment': 'Estimated Monthly Payments',
-        # 6. Property Description & Highlights
-        'description': "What's Special About This Property",
-        'features': 'Features & Upgrades',
-        'special_features': 'Unique Selling Points',
-        # 7. Multimedia & Virtual Tours
-        'tour_3d_url': '3D Tour',
-        'video_tour_url': 'Video Tour',
-        # 8. Source & Listing Data
-        'agent_name': 'Listed By',
-        'mls_id': 'MLS Number',
-        'mls': 'Originating MLS',
-        # 9. Legal & Tax Information
-        'tax_history': 'Public Tax History',
-        'tax': 'Tax Assessed Value',
-        # 10. Facts & Features
-        'property_type': 'Property Type',
-        'interior_features': 'Interior Features',
-        'exterior_features': 'Exterior Features',
-        # 11. Historical Data
-        'sale_history': 'Sale History',
-        # 12. Environmental & Climate Risk
-        'climate_risk': 'Climate Risk',
-        # 13. Getting Around
-        'commute': 'Getting Around',
-        # 14. Nearby Amenities & Education
-        'nearby_schools': 'Nearby Schools',
-        'nearby_cities': 'Nearby Cities',
-        'parks': 'Parks & Recreation',
-    }
-    tasks = [
-        (state, args.listing_types, args.start_date, args.end_date, args.max_rows, args.output_dir, args.output_format, args.overwrite, columns_map)
-        for state in args.states
-    ]
+    cfg = ScrapeConfig(
+        listing_types=tuple(args.listing_types),
+        start_date=args.start_date,
+        end_date=args.end_date,
+        max_rows=args.max_rows,
+        output_dir=args.output_dir,
+        output_format=args.output_format,
+        overwrite=args.overwrite,
+        extra_property_data=not args.no_extra_details,
+        use_cache=not args.no_cache,
+    )
+    tasks = list(args.states)
+    if not cfg.overwrite:
+        # Drop finished states up front instead of shipping them to workers just to be skipped
+        skipped = [state for state in tasks if state_is_exported(cfg, state)]
+        if skipped:
+            tasks = [state for state in tasks if state not in skipped]
+            logging.info(f"Skipping {len(skipped)} states with existing exports: {', '.join(skipped)}")
+            print(f"Skipping {len(skipped)} states with existing exports: {', '.join(skipped)}")
     if args.processes > 1:
-        with Pool(args.processes) as pool:
-            pool.map(process_state_cli, tasks)
+        # A single listener in the parent is the only writer to the log file
+        log_queue = Queue(-1)
+        listener = QueueListener(log_queue, file_handler)
+        listener.start()
+        try:
+            with Pool(args.processes, initializer=init_worker, initargs=(cfg, log_queue)) as pool:
+                # Results are written by each worker, so drain states in completion order
+                for _ in pool.imap_unordered(process_state_cli, tasks, chunksize=1):
+                    pass
+                # Let workers exit cleanly so queued log records are flushed before terminate
+                pool.close()
+                pool.join()
+        finally:
+            listener.stop()
     else:
-        for t in tasks:
-            process_state_cli(t)
+        init_worker(cfg)
+        for state in tasks:
+            process_state_cli(state)
     print("Done. See fetch_all_states.log for details.")
 
 if __name__ == "__main__":
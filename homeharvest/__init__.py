@@ -20,7 +20,8 @@ def scrape_property(
     foreclosure: bool = None,
     extra_property_data: bool = True,
     exclude_pending: bool = False,
-    limit: int = 10000
+    limit: int = 10000,
+    full_search_data: bool = False,
 ) -> pd.DataFrame | list[dict] | list[Property]:
     """
     Scrape properties from Realtor.com based on a given location and listing type.
@@ -37,6 +38,7 @@ def scrape_property(
     :param extra_property_data: Increases requests by O(n). If set, this fetches additional property data (e.g. agent, broker, property evaluations etc.)
     :param exclude_pending: If true, this excludes pending or contingent properties from the results, unless listing type is pending.
     :param limit: Limit the number of results returned. Maximum is 10,000.
+    :param full_search_data: If set, requests every search field realtor exposes (e.g. pet policy, units, tax record) instead of only the fields HomeHarvest parses. Mainly useful with return_type="raw".
     """
     validate_input(listing_type)
     validate_dates(date_from, date_to)
@@ -57,6 +59,7 @@ def scrape_property(
         extra_property_data=extra_property_data,
         exclude_pending=exclude_pending,
         limit=limit,
+        full_search_data=full_search_data,
     )
 
     site = RealtorScraper(scraper_input)
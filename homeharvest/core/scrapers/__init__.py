@@ -5,6 +5,7 @@ from typing import Union
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 import uuid
 from ...exceptions import AuthenticationError
 from .models import Property, ListingType, SiteName, SearchPropertyType, ReturnType
@@ -27,10 +28,13 @@ class ScraperInput:
     exclude_pending: bool | None = False
     limit: int = 10000
     return_type: ReturnType = ReturnType.pandas
+    full_search_data: bool | None = False
 
 
 class Scraper:
     session = None
+    #: searches fan out across thread pools, keep enough connections alive to avoid re-handshaking per page
+    POOL_MAXSIZE = 64
 
     def __init__(
         self,
@@ -46,13 +50,14 @@ class Scraper:
                 total=3, backoff_factor=4, status_forcelist=[429, 403], allowed_methods=frozenset(["GET", "POST"])
             )
 
-            adapter = HTTPAdapter(max_retries=retries)
+            adapter = HTTPAdapter(pool_maxsize=self.POOL_MAXSIZE, max_retries=retries)
             Scraper.session.mount("http://", adapter)
             Scraper.session.mount("https://", adapter)
             Scraper.session.headers.update(
                 {
                     "accept": "application/json, text/javascript",
                     "accept-language": "en-US,en;q=0.9",
+                    "accept-encoding": ACCEPT_ENCODING,  #: gzip/deflate, plus br/zstd when their decoders are installed
                     "cache-control": "no-cache",
                     "content-type": "application/json",
                     "origin": "https://www.realtor.com",
@@ -85,6 +90,7 @@ class Scraper:
         self.exclude_pending = scraper_input.exclude_pending
         self.limit = scraper_input.limit
         self.return_type = scraper_input.return_type
+        self.full_search_data = scraper_input.full_search_data
 
     def search(self) -> list[Union[Property | dict]]: ...
 
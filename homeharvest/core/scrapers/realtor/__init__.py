@@ -10,9 +10,15 @@ from __future__ import annotations
 import json
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from json import JSONDecodeError
 from typing import Dict, Union, Optional
 
+try:
+    from orjson import loads as json_loads  #: optional, decodes the large search responses much faster
+except ImportError:
+    from json import loads as json_loads
+
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -34,7 +40,13 @@ from ..models import (
     Office,
     ReturnType
 )
-from .queries import GENERAL_RESULTS_QUERY, SEARCH_HOMES_DATA, HOMES_DATA, HOME_FRAGMENT
+from .queries import (
+    GENERAL_RESULTS_QUERY,
+    GENERAL_RESULTS_QUERY_FULL,
+    HOMES_DATA,
+    HOMES_DATA_FULL,
+    HOME_FRAGMENT,
+)
 
 
 class RealtorScraper(Scraper):
@@ -48,6 +60,9 @@ class RealtorScraper(Scraper):
     def __init__(self, scraper_input):
         super().__init__(scraper_input)
 
+        self.homes_data = HOMES_DATA_FULL if self.full_search_data else HOMES_DATA
+        self.general_results_query = GENERAL_RESULTS_QUERY_FULL if self.full_search_data else GENERAL_RESULTS_QUERY
+
     def handle_location(self):
         params = {
             "input": self.location,
@@ -60,7 +75,7 @@ class RealtorScraper(Scraper):
             self.ADDRESS_AUTOCOMPLETE_URL,
             params=params,
         )
-        response_json = response.json()
+        response_json = json_loads(response.content)
 
         result = response_json["autocomplete"]
 
@@ -87,7 +102,7 @@ class RealtorScraper(Scraper):
         }
 
         response = self.session.post(self.SEARCH_GQL_URL, json=payload)
-        response_json = response.json()
+        response_json = json_loads(response.content)
 
         property_info = response_json["data"]["property"]
         if property_info["listings"] is None:
@@ -103,21 +118,18 @@ class RealtorScraper(Scraper):
             return property_info["listings"][0]["listing_id"]
 
     def handle_home(self, property_id: str) -> list[Property]:
-        query = (
-            """query Home($property_id: ID!) {
+        query = """query Home($property_id: ID!) {
                     home(property_id: $property_id) %s
-                }"""
-            % HOMES_DATA
+                }
+                %s""" % (
+            self.homes_data,
+            HOME_FRAGMENT,
         )
 
         variables = {"property_id": property_id}
-        payload = {
-            "query": query,
-            "variables": variables,
-        }
 
-        response = self.session.post(self.SEARCH_GQL_URL, json=payload)
-        response_json = response.json()
+        response = self.session.post(self.SEARCH_GQL_URL, data=self.build_graphql_body(query, variables))
+        response_json = json_loads(response.content)
 
         property_info = response_json["data"]["home"]
 
@@ -126,6 +138,20 @@ class RealtorScraper(Scraper):
         else:
             return [property_info]
 
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def encode_query(query: str) -> bytes:
+        """
+        JSON-encode a query string once; paginated searches resend the same query for every page
+        """
+        return json.dumps(query).encode("utf-8")
+
+    @classmethod
+    def build_graphql_body(cls, query: str, variables: dict) -> bytes:
+        return (
+            b'{"query": ' + cls.encode_query(query) + b', "variables": ' + json.dumps(variables).encode("utf-8") + b"}"
+        )
+
     @staticmethod
     def process_advertisers(advertisers: list[dict] | None) -> Advertisers | None:
         if not advertisers:
@@ -304,7 +330,7 @@ class RealtorScraper(Scraper):
                 property_type_param,
                 pending_or_contingent_param,
                 sort_param,
-                GENERAL_RESULTS_QUERY,
+                self.general_results_query,
             )
         elif search_type == "area":  #: general search, came from a general location
             query = """query Home_search(
@@ -338,7 +364,7 @@ class RealtorScraper(Scraper):
                 property_type_param,
                 pending_or_contingent_param,
                 sort_param,
-                GENERAL_RESULTS_QUERY,
+                self.general_results_query,
             )
         else:  #: general search, came from an address
             query = (
@@ -354,16 +380,11 @@ class RealtorScraper(Scraper):
                             offset: $offset
                         ) %s
                     }"""
-                % GENERAL_RESULTS_QUERY
+                % self.general_results_query
             )
 
-        payload = {
-            "query": query,
-            "variables": variables,
-        }
-
-        response = self.session.post(self.SEARCH_GQL_URL, json=payload)
-        response_json = response.json()
+        response = self.session.post(self.SEARCH_GQL_URL, data=self.build_graphql_body(query, variables))
+        response_json = json_loads(response.content)
         search_key = "home_search" if "home_search" in query else "property_search"
 
         properties: list[Union[Property, dict]] = []
@@ -556,7 +577,7 @@ class RealtorScraper(Scraper):
         }}"""
 
         response = self.session.post(self.SEARCH_GQL_URL, json={"query": query})
-        data = response.json()
+        data = json_loads(response.content)
 
         if "data" not in data:
             return {}
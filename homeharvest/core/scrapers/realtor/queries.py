@@ -1,4 +1,4 @@
-_SEARCH_HOMES_DATA_BASE = """{
+_SEARCH_HOMES_DATA_FULL = """{
     pending_date
     listing_id
     property_id
@@ -166,6 +166,117 @@ _SEARCH_HOMES_DATA_BASE = """{
     """
 
 
+#: only the fields parsed into Property, used by default to keep responses small
+_SEARCH_HOMES_DATA_MINIMAL = """{
+    pending_date
+    listing_id
+    property_id
+    href
+    list_date
+    status
+    last_sold_price
+    last_sold_date
+    list_price
+    list_price_max
+    list_price_min
+    price_per_sqft
+    tags
+    details {
+        category
+        text
+        parent_category
+    }
+    flags {
+        is_contingent
+        is_pending
+        is_new_construction
+    }
+    description {
+        type
+        sqft
+        beds
+        baths_full
+        baths_half
+        lot_sqft
+        year_built
+        garage
+        stories
+        text
+    }
+    source {
+        id
+        listing_id
+    }
+    hoa {
+        fee
+    }
+    location {
+        address {
+            street_direction
+            street_number
+            street_name
+            street_suffix
+            line
+            unit
+            city
+            state_code
+            postal_code
+            coordinate {
+                lon
+                lat
+            }
+        }
+        county {
+            name
+            fips_code
+        }
+        neighborhoods {
+            name
+        }
+    }
+    primary_photo(https: true) {
+        href
+    }
+    photos(https: true) {
+        href
+    }
+    advertisers {
+        email
+        broker {
+            name
+            fulfillment_id
+        }
+        type
+        name
+        fulfillment_id
+        builder {
+            name
+            fulfillment_id
+        }
+        phones {
+            ext
+            primary
+            type
+            number
+        }
+        office {
+            name
+            email
+            fulfillment_id
+            phones {
+                number
+                type
+                primary
+                ext
+            }
+            mls_set
+        }
+        mls_set
+        nrds_id
+    }
+    """
+
+
 HOME_FRAGMENT = """
 fragment HomeData on Home {
     property_id
@@ -194,29 +305,9 @@ fragment HomeData on Home {
 }
 """
 
-HOMES_DATA = """%s
-                nearbySchools: nearby_schools(radius: 5.0, limit_per_level: 3) {
-                            __typename schools { district { __typename id name } }
-                        }
-                monthly_fees {
-                    description
-                    display_amount
-                }
-                one_time_fees {
-                    description
-                    display_amount
-                }
-                parking {
-                    unassigned_space_rent
-                    assigned_spaces_available
-                    description
-                    assigned_space_rent
-                }
-                terms {
-                    text
-                    category
-                }
-                taxHistory: tax_history { __typename tax year assessment { __typename building land total } }
+#: spreads HomeData, so HOME_FRAGMENT must be sent alongside any query using HOMES_DATA
+_HOMES_DATA_TEMPLATE = """%s
+                ...HomeData
                 estimates {
                     __typename
                     currentValues: current_values {
@@ -229,9 +320,9 @@ HOMES_DATA = """%s
                         isBestHomeValue: isbest_homevalue
                     }
                 }
-}""" % _SEARCH_HOMES_DATA_BASE
+}"""
 
-SEARCH_HOMES_DATA = """%s
+_SEARCH_HOMES_DATA_TEMPLATE = """%s
 current_estimates {
     __typename
     source {
@@ -245,10 +336,19 @@ current_estimates {
     date
     isBestHomeValue: isbest_homevalue
 }
-}""" % _SEARCH_HOMES_DATA_BASE
+}"""
 
-GENERAL_RESULTS_QUERY = """{
+_GENERAL_RESULTS_QUERY_TEMPLATE = """{
                             count
                             total
                             results %s
-                        }""" % SEARCH_HOMES_DATA
+                        }"""
+
+HOMES_DATA = _HOMES_DATA_TEMPLATE % _SEARCH_HOMES_DATA_MINIMAL
+SEARCH_HOMES_DATA = _SEARCH_HOMES_DATA_TEMPLATE % _SEARCH_HOMES_DATA_MINIMAL
+GENERAL_RESULTS_QUERY = _GENERAL_RESULTS_QUERY_TEMPLATE % SEARCH_HOMES_DATA
+
+#: every search field realtor exposes, for callers that need the raw payload
+HOMES_DATA_FULL = _HOMES_DATA_TEMPLATE % _SEARCH_HOMES_DATA_FULL
+SEARCH_HOMES_DATA_FULL = _SEARCH_HOMES_DATA_TEMPLATE % _SEARCH_HOMES_DATA_FULL
+GENERAL_RESULTS_QUERY_FULL = _GENERAL_RESULTS_QUERY_TEMPLATE % SEARCH_HOMES_DATA_FULL
@@ -0,0 +1,96 @@
+import importlib.util
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from homeharvest.utils import ordered_properties
+
+pa = pytest.importorskip("pyarrow")
+feather = pytest.importorskip("pyarrow.feather")
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples" / "examples"
+
+
+def load_example(name):
+    spec = importlib.util.spec_from_file_location(name, EXAMPLES_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def fake_scrape_property(**kwargs):
+    # Only sold listings have an MLS and city, so both columns are all-null in every other chunk
+    properties = pd.DataFrame({column: [None] * 3 for column in ordered_properties})
+    properties["property_id"] = [f"{kwargs['listing_type']}{i}" for i in range(3)]
+    properties["state"] = kwargs["location"]
+    properties["status"] = kwargs["listing_type"].upper()
+    if kwargs["listing_type"] == "sold":
+        properties["mls"] = "ABC"
+        properties["city"] = "Surprise"
+    return properties
+
+
+@pytest.fixture
+def fetch_all_states(tmp_path, monkeypatch):
+    # The script creates its output directories on import
+    monkeypatch.chdir(tmp_path)
+    module = load_example("fetch_all_states")
+    monkeypatch.setattr(module, "scrape_property", fake_scrape_property)
+    return module
+
+
+def test_arrow_export_with_all_null_category_column(fetch_all_states, tmp_path):
+    cfg = fetch_all_states.ScrapeConfig(
+        listing_types=("sold", "for_sale", "pending"),
+        start_date="2024-01-01",
+        end_date="2024-02-01",
+        max_rows=500,
+        output_dir=str(tmp_path),
+        output_format="arrow",
+        overwrite=True,
+        extra_property_data=False,
+        use_cache=False,
+    )
+    fetch_all_states.init_worker(cfg)
+    fetch_all_states.process_state_cli("AZ")
+
+    table = feather.read_table(tmp_path / "AZ_properties.arrow")
+    assert table.num_rows == 9
+    assert pa.types.is_dictionary(table.schema.field("mls").type)
+    assert table.column("mls").to_pylist() == ["ABC"] * 3 + [None] * 6
+
+
+def test_concat_states_with_null_dictionary(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    concat_all_states = load_example("concat_all_states")
+    # A state whose city column was all null was once written as a null-valued dictionary
+    null_cities = pa.array([None, None]).dictionary_encode()
+    cities = pa.array(["Surprise", "Phoenix"]).dictionary_encode()
+    feather.write_feather(pa.table({"city": null_cities}), tmp_path / "AK_properties.arrow")
+    feather.write_feather(pa.table({"city": cities}), tmp_path / "AZ_properties.arrow")
+
+    output = tmp_path / "all_states.arrow"
+    monkeypatch.setattr("sys.argv", ["concat_all_states.py", "--input_dir", str(tmp_path), "--output", str(output)])
+    concat_all_states.main()
+
+    assert feather.read_table(output).column("city").to_pylist() == [None, None, "Surprise", "Phoenix"]
+
+
+def test_date_buckets_fill_max_rows_with_unique_properties(fetch_all_states, monkeypatch):
+    calls = []
+
+    def overlapping_buckets(**kwargs):
+        # The first two buckets both return a property listed on their shared boundary
+        calls.append(kwargs["date_to"])
+        ids = ["shared"] if len(calls) <= 2 else []
+        ids += [f"{kwargs['date_to']}-{i}" for i in range(kwargs["limit"] - len(ids))]
+        return pd.DataFrame({"property_id": ids})
+
+    monkeypatch.setattr(fetch_all_states, "scrape_property", overlapping_buckets)
+    monkeypatch.setattr(fetch_all_states, "SCRAPE_LIMIT", 3)
+    properties = fetch_all_states.fetch_listing_type("AZ", "sold", "2024-01-01", "2024-12-31", 7, False)
+
+    assert len(properties) == 7
+    assert properties["property_id"].is_unique
+    assert len(calls) == 3
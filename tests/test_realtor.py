@@ -303,3 +303,13 @@ def test_return_type():
     assert all(isinstance(result, pd.DataFrame) for result in results["pandas"])
     assert all(isinstance(result[0], Property) for result in results["pydantic"])
     assert all(isinstance(result[0], dict) for result in results["raw"])
+
+
+def test_full_search_data():
+    minimal = scrape_property(location="Surprise, AZ", listing_type="for_rent", limit=10, return_type="raw")
+    full = scrape_property(
+        location="Surprise, AZ", listing_type="for_rent", limit=10, return_type="raw", full_search_data=True
+    )
+
+    assert all("units" not in result for result in minimal)
+    assert all("units" in result for result in full)